@@ -3,8 +3,9 @@ Main Flask application for Seizure Prediction Web App
 A patient-centered web application for predicting seizures using ML models.
 """
 
-from flask import Flask, send_from_directory
+from flask import Flask, jsonify, redirect
 from flask_cors import CORS
+from whitenoise import WhiteNoise
 import os
 
 # Import configuration
@@ -13,6 +14,9 @@ from config import config
 # Import database
 from models.database import init_db
 
+# Import JSON provider
+from utils.serialization import ORJSONProvider, PreEncodedJSON
+
 # Import blueprints
 from routes.predict import predict_bp
 from routes.appointments import appointments_bp
@@ -20,6 +24,24 @@ from routes.medication import medication_bp
 from routes.progress import progress_bp
 from routes.payments import payments_bp
 
+# Static frontend served by WhiteNoise ahead of Flask routing
+FRONTEND_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'frontend-ui')
+FRONTEND_PAGES = ['predict', 'appointments', 'medication', 'progress']
+
+# Legacy .html URL -> canonical page URL (WhiteNoise itself redirects /index.html to /)
+_REDIRECTS = {page: f'/{page}' for page in FRONTEND_PAGES}
+
+def _frontend_cache_headers(headers, path, url):
+    """Set Cache-Control for static frontend files served by WhiteNoise."""
+    # Pages and assets keep their URLs across deploys, so they are cached
+    # briefly and then revalidated (a 304 via ETag when unchanged)
+    headers['Cache-Control'] = 'public, max-age=300'
+
+def redirect_html(page):
+    """Redirect a legacy .html page URL to its route (for user convenience)."""
+    target = _REDIRECTS.get(page)
+    return redirect(target) if target else ('', 404)
+
 def create_app(config_name=None):
     """Application factory pattern."""
     if config_name is None:
@@ -27,11 +49,48 @@ def create_app(config_name=None):
     
     app = Flask(__name__, static_folder='frontend-ui/assets')
     
+    # Serve the static frontend (HTML pages and /assets/*) straight from a
+    # precomputed file index, bypassing Flask routing entirely
+    app.wsgi_app = WhiteNoise(
+        app.wsgi_app,
+        root=FRONTEND_ROOT,
+        prefix='/',
+        max_age=300,
+        autorefresh=False,
+        index_file=True,
+        add_headers_function=_frontend_cache_headers
+    )
+    for page in FRONTEND_PAGES:
+        # Extensionless page URLs (e.g. /predict) map to their HTML file; the
+        # .html URL is dropped from the index so it falls through to Flask,
+        # which redirects it to the extensionless one
+        app.wsgi_app.add_file_to_dictionary(f'/{page}', os.path.join(FRONTEND_ROOT, f'{page}.html'))
+        app.wsgi_app.files.pop(f'/{page}.html', None)
+    
     # Load configuration
-    app.config.from_object(config[config_name])
+    config_class = config[config_name]
+    app.config.from_object(config_class)
+    
+    # Resolve environment-dependent database settings at creation time
+    database_uri = config_class.get_uri()
+    app.config['SQLALCHEMY_DATABASE_URI'] = database_uri
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = config_class.get_engine_options(database_uri)
+    app.config['MAX_CONTENT_LENGTH'] = config_class.get_max_content_length()
     
-    # Initialize extensions
-    CORS(app)
+    # Encode API responses with orjson (compact, no debug pretty printing)
+    app.json = ORJSONProvider(app)
+    
+    # Initialize extensions: cross-origin API access only for configured
+    # origins (browsers cache preflight results for 24h)
+    cors_origins = config_class.get_cors_origins()
+    if cors_origins:
+        CORS(
+            app,
+            resources={r"/api/*": {"origins": cors_origins}},
+            max_age=86400,
+            methods=["GET", "POST", "PUT", "DELETE"],
+            allow_headers=["Content-Type", "Accept", "Authorization", "Idempotency-Key"]
+        )
     init_db(app)
     
     # Register blueprints
@@ -40,6 +99,7 @@ def create_app(config_name=None):
     app.register_blueprint(medication_bp, url_prefix='/api')
     app.register_blueprint(progress_bp, url_prefix='/api')
     app.register_blueprint(payments_bp, url_prefix='/api')
+    app.add_url_rule('/<page>.html', 'redirect_html', redirect_html)
     
     return app
 
@@ -47,58 +107,28 @@ def create_app(config_name=None):
 app = create_app()
 
 # Health check endpoints
+# Payload never changes, so serialize it once instead of on every probe
+_API_HEALTH = PreEncodedJSON({
+    "status": "success",
+    "message": "API endpoints are available",
+    "endpoints": [
+        "/api/predict",
+        "/api/appointments",
+        "/api/medication",
+        "/api/progress",
+        "/api/payments/config",
+        "/api/payments/create-intent"
+    ]
+})
+
 @app.route('/api/health')
 def api_health():
-    return {
-        "status": "success",
-        "message": "API endpoints are available",
-        "endpoints": [
-            "/api/predict",
-            "/api/appointments",
-            "/api/medication",
-            "/api/progress",
-            "/api/payments/config",
-            "/api/payments/create-intent"
-        ]
-    }
-
-# Serve static HTML pages
-@app.route('/')
-def serve_index():
-    return send_from_directory('frontend-ui', 'index.html')
-
-@app.route('/appointments')
-def serve_appointments():
-    return send_from_directory('frontend-ui', 'appointments.html')
-
-@app.route('/medication')
-def serve_medication():
-    return send_from_directory('frontend-ui', 'medication.html')
-
-@app.route('/progress')
-def serve_progress():
-    return send_from_directory('frontend-ui', 'progress.html')
-
-@app.route('/assets/<path:filename>')
-def serve_assets(filename):
-    return send_from_directory('frontend-ui/assets', filename)
-
-# Redirect .html URLs to the correct route (optional, for user convenience)
-@app.route('/<page>.html')
-def redirect_html(page):
-    from flask import redirect
-    if page in ['index', 'predict', 'appointments', 'medication', 'progress']:
-        return redirect('/' if page == 'index' else f'/{page}')
-    return '', 404
-
-# Handle /predict route to serve the predict page
-@app.route('/predict')
-def serve_predict():
-    return send_from_directory('frontend-ui', 'predict.html')
-
-# Print all registered routes for debugging
-for rule in app.url_map.iter_rules():
-    print(rule)
+    return jsonify(_API_HEALTH)
 
 if __name__ == '__main__':
+    # Print all registered routes for debugging (opt-in)
+    if os.environ.get('FLASK_DEBUG_ROUTES'):
+        for rule in app.url_map.iter_rules():
+            print(rule)
+    
     app.run(debug=True) 
\ No newline at end of file
@@ -9,27 +9,81 @@ class Config:
     """Base configuration class."""
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    
+    # Drop dead connections before use and recycle long-lived ones
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_pre_ping': True,
+        'pool_recycle': 1800
+    }
+    
+    @staticmethod
+    def get_uri():
+        """Resolve the database URI when the app is created, not at import."""
+        return os.environ.get('DATABASE_URL') or 'sqlite:///dev.db'
+    
+    @classmethod
+    def get_engine_options(cls, database_uri):
+        """Return SQLAlchemy engine options for the given database URI."""
+        return cls.SQLALCHEMY_ENGINE_OPTIONS
+    
+    @staticmethod
+    def get_max_content_length():
+        """
+        Resolve the request body size limit in bytes (MAX_CONTENT_LENGTH, 2 MiB by default).
+        
+        Bodies over it (JSON or feature-file uploads) are rejected with a 413
+        before they are read or parsed.
+        """
+        return int(os.environ.get('MAX_CONTENT_LENGTH', 2 * 1024 * 1024))
+    
+    @staticmethod
+    def get_cors_origins():
+        """
+        Resolve the origins allowed to call /api/* cross-origin.
+        
+        Read from the comma-separated CORS_ORIGINS variable when the app is
+        created; unset means no cross-origin access (the bundled frontend is
+        same-origin), never a wildcard.
+        """
+        origins = os.environ.get('CORS_ORIGINS', '')
+        return [origin.strip() for origin in origins.split(',') if origin.strip()]
 
 class DevelopmentConfig(Config):
     """Development configuration."""
     DEBUG = True
-    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///dev.db'
 
 class ProductionConfig(Config):
     """Production configuration."""
     DEBUG = False
     
-    # Handle PostgreSQL URL from Render
-    database_url = os.environ.get('DATABASE_URL')
-    if database_url and database_url.startswith('postgres://'):
-        database_url = database_url.replace('postgres://', 'postgresql://', 1)
+    @staticmethod
+    def get_uri():
+        # Handle PostgreSQL URL from Render
+        database_url = os.environ.get('DATABASE_URL')
+        if database_url and database_url.startswith('postgres://'):
+            database_url = database_url.replace('postgres://', 'postgresql://', 1)
+        
+        return database_url or 'sqlite:///prod.db'
     
-    SQLALCHEMY_DATABASE_URI = database_url or 'sqlite:///prod.db'
+    @classmethod
+    def get_engine_options(cls, database_uri):
+        # Size the PostgreSQL pool for threaded gunicorn workers
+        if database_uri.startswith('postgresql://'):
+            return {
+                **cls.SQLALCHEMY_ENGINE_OPTIONS,
+                'pool_size': 10,
+                'max_overflow': 20,
+                'connect_args': {'keepalives': 1}
+            }
+        return cls.SQLALCHEMY_ENGINE_OPTIONS
 
 class TestingConfig(Config):
     """Testing configuration."""
     TESTING = True
-    SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    
+    @staticmethod
+    def get_uri():
+        return 'sqlite:///:memory:'
 
 # Configuration dictionary
 config = {
@@ -37,4 +91,4 @@ config = {
     'production': ProductionConfig,
     'testing': TestingConfig,
     'default': DevelopmentConfig
-}
+}
\ No newline at end of file
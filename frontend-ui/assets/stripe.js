@@ -75,10 +75,14 @@ document.addEventListener('DOMContentLoaded', async function () {
 
       try {
         // 2) Create PaymentIntent on server
+        // A fresh Idempotency-Key per payment attempt, so every booking gets its own PaymentIntent
         const meta = { patient, doctor, date, time };
         const piResp = await fetch('/api/payments/create-intent', {
           method: 'POST',
-          headers: { 'Content-Type': 'application/json' },
+          headers: {
+            'Content-Type': 'application/json',
+            'Idempotency-Key': crypto.randomUUID()
+          },
           body: JSON.stringify({ metadata: meta })
         });
         const pi = await piResp.json();
@@ -1,8 +1,9 @@
 from . import frontend_bp
 from flask import render_template, request
-import requests
-
-API_BASE = 'http://localhost:5000/api'
+from services import appointments as appointments_service
+from services import medication as medication_service
+from services import predict as predict_service
+from services import progress as progress_service
 
 @frontend_bp.route('/', methods=['GET'])
 def home():
@@ -16,11 +17,11 @@ def predict():
         features = request.form.get('features', '')
         try:
             features_list = [float(x.strip()) for x in features.split(',')]
-            resp = requests.post(f'{API_BASE}/predict', json={'features': features_list})
-            if resp.ok:
-                result = resp.json()
+            payload, status = predict_service.predict_seizure(features_list)
+            if status < 400:
+                result = payload
             else:
-                error = resp.json().get('message', 'Prediction failed.')
+                error = payload.get('message', 'Prediction failed.')
         except Exception as e:
             error = str(e)
     return render_template('predict.html', result=result, error=error)
@@ -32,20 +33,14 @@ def appointments():
     appointments = []
     if request.method == 'POST':
         data = {k: request.form[k] for k in ['patient', 'doctor', 'date', 'time']}
-        try:
-            resp = requests.post(f'{API_BASE}/appointments', json=data)
-            if resp.ok:
-                result = 'Appointment booked!'
-            else:
-                error = resp.json().get('message', 'Booking failed.')
-        except Exception as e:
-            error = str(e)
-    try:
-        resp = requests.get(f'{API_BASE}/appointments')
-        if resp.ok:
-            appointments = resp.json()
-    except Exception:
-        pass
+        payload, status = appointments_service.book_appointment(data)
+        if status < 400:
+            result = 'Appointment booked!'
+        else:
+            error = payload.get('message', 'Booking failed.')
+    payload, status = appointments_service.get_appointments()
+    if status < 400:
+        appointments = payload
     return render_template('appointments.html', result=result, error=error, appointments=appointments)
 
 @frontend_bp.route('/medication', methods=['GET', 'POST'])
@@ -57,20 +52,14 @@ def medication():
         data = {k: request.form.get(k, '') for k in ['patient', 'drug_name', 'dosage', 'instructions', 'times']}
         if data['times']:
             data['times'] = [t.strip() for t in data['times'].split(',')]
-        try:
-            resp = requests.post(f'{API_BASE}/medication', json=data)
-            if resp.ok:
-                result = 'Medication scheduled!'
-            else:
-                error = resp.json().get('message', 'Scheduling failed.')
-        except Exception as e:
-            error = str(e)
-    try:
-        resp = requests.get(f'{API_BASE}/medication')
-        if resp.ok:
-            medications = resp.json()
-    except Exception:
-        pass
+        payload, status = medication_service.schedule_medication(data)
+        if status < 400:
+            result = 'Medication scheduled!'
+        else:
+            error = payload.get('message', 'Scheduling failed.')
+    payload, status = medication_service.get_medications()
+    if status < 400:
+        medications = payload
     return render_template('medication.html', result=result, error=error, medications=medications)
 
 @frontend_bp.route('/progress', methods=['GET', 'POST'])
@@ -82,17 +71,14 @@ def progress():
         data = {k: request.form.get(k, '') for k in ['date', 'patient', 'occurred', 'notes']}
         try:
             data['occurred'] = int(data['occurred'])
-            resp = requests.post(f'{API_BASE}/progress', json=data)
-            if resp.ok:
+            payload, status = progress_service.log_seizure(data)
+            if status < 400:
                 result = 'Progress logged!'
             else:
-                error = resp.json().get('message', 'Logging failed.')
+                error = payload.get('message', 'Logging failed.')
         except Exception as e:
             error = str(e)
-    try:
-        resp = requests.get(f'{API_BASE}/progress')
-        if resp.ok:
-            progress_logs = resp.json()
-    except Exception:
-        pass
+    payload, status = progress_service.get_progress()
+    if status < 400:
+        progress_logs = payload
     return render_template('progress.html', result=result, error=error, progress_logs=progress_logs)
\ No newline at end of file
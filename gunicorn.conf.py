@@ -0,0 +1,32 @@
+"""
+Gunicorn configuration for Seizure Prediction Web App
+"""
+
+import os
+
+# Bind to the port provided by the platform (Render sets PORT)
+bind = '0.0.0.0:' + os.environ.get('PORT', '5000')
+
+# Threaded workers overlap blocking DB / HTTP calls within each worker.
+# Appointments, medication and progress data live in process memory, so keep
+# a single worker by default; raise WEB_CONCURRENCY once storage is shared.
+worker_class = 'gthread'
+workers = int(os.environ.get('WEB_CONCURRENCY', 1))
+threads = int(os.environ.get('GUNICORN_THREADS', 5))
+
+# Import the app once in the master so workers share imported code via fork
+preload_app = True
+
+# Static files are returned by WhiteNoise through wsgi.file_wrapper; keep
+# sendfile(2) on so the kernel copies them straight to the socket
+sendfile = True
+
+def post_fork(server, worker):
+    """Give each worker its own database connections."""
+    # With preload_app the master's create_app() already opened pooled
+    # connections (db.create_all); drop them from the worker's pool without
+    # closing them, so no socket is shared with the master or other workers
+    from app import app
+    from models.database import db
+    with app.app_context():
+        db.engine.dispose(close=False)
@@ -1,5 +1,7 @@
 """
 Database models for Seizure Prediction Web App
+to_dict() leaves dates and datetimes as objects; the app's orjson JSON
+provider encodes them as ISO 8601 strings.
 """
 
 from flask_sqlalchemy import SQLAlchemy
@@ -27,12 +29,12 @@ class Appointment(db.Model):
             'id': self.id,
             'patient': self.patient,
             'doctor': self.doctor,
-            'date': self.date.strftime('%Y-%m-%d') if self.date else None,
+            'date': self.date,
             'time': self.time.strftime('%H:%M') if self.time else None,
             'status': self.status,
             'notes': self.notes,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
 
 class Medication(db.Model):
@@ -59,8 +61,8 @@ class Medication(db.Model):
             'times': self.times,
             'instructions': self.instructions,
             'active': self.active,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
 
 class SeizureLog(db.Model):
@@ -82,19 +84,30 @@ class SeizureLog(db.Model):
         return {
             'id': self.id,
             'patient': self.patient,
-            'date': self.date.strftime('%Y-%m-%d') if self.date else None,
+            'date': self.date,
             'occurred': self.occurred,
             'notes': self.notes,
             'severity': self.severity,
             'duration': self.duration,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
 
+# Database URIs whose schema this process has already created, so repeated
+# create_app() calls (tests, preload + workers) skip create_all
+_schema_created = set()
+
 def init_db(app):
     """Initialize database with Flask app."""
     db.init_app(app)
     
+    database_uri = app.config['SQLALCHEMY_DATABASE_URI']
+    if database_uri in _schema_created:
+        return
+    
     with app.app_context():
         db.create_all()
         print("Database tables created successfully!")
+    # An in-memory database belongs to its app's engine, so every app needs its own schema
+    if ':memory:' not in database_uri:
+        _schema_created.add(database_uri)
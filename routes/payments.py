@@ -3,10 +3,19 @@ Stripe payments endpoints for appointment booking.
 Provides endpoints to fetch publishable key and create PaymentIntents.
 """
 
+import hashlib
 import os
 import re
-from flask import Blueprint, jsonify, request
+import threading
+from cachetools import TTLCache
+from flask import Blueprint, Response, jsonify, request
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
 import stripe
+from werkzeug.exceptions import RequestEntityTooLarge
+
+from utils.serialization import PreEncodedJSON
 
 payments_bp = Blueprint('payments', __name__)
 
@@ -33,19 +42,84 @@ STRIPE_SECRET_KEY = os.environ.get('STRIPE_SECRET_KEY', '')
 STRIPE_PUBLISHABLE_KEY = os.environ.get('STRIPE_PUBLISHABLE_KEY', '')
 STRIPE_CURRENCY = (os.environ.get('STRIPE_CURRENCY') or 'usd').lower()
 APPOINTMENT_PRICE_CENTS = _parse_int_env('APPOINTMENT_PRICE_CENTS', 2000)  # default $20.00
+# Retries run synchronously in the request thread, so keep them few
+STRIPE_MAX_NETWORK_RETRIES = _parse_int_env('STRIPE_MAX_NETWORK_RETRIES', 1)
+# Upper bound (seconds) on how long one Stripe call can hold a worker thread;
+# the SDK default read timeout is 80s
+STRIPE_TIMEOUT_SECONDS = _parse_int_env('STRIPE_TIMEOUT_SECONDS', 15)
 
 # Initialize Stripe client if key present
 if STRIPE_SECRET_KEY:
     stripe.api_key = STRIPE_SECRET_KEY
+    stripe.max_network_retries = STRIPE_MAX_NETWORK_RETRIES
+
+    # One pooled session for all request threads keeps connections to
+    # api.stripe.com alive instead of paying a TCP + TLS handshake per call
+    _stripe_session = requests.Session()
+    _stripe_session.mount('https://', HTTPAdapter(pool_connections=20, pool_maxsize=50))
+    stripe.default_http_client = stripe.RequestsClient(
+        session=_stripe_session,
+        timeout=(5, STRIPE_TIMEOUT_SECONDS)
+    )
+
+# Config is fixed for the life of the process: encode it and its ETag once
+_CONFIG_BODY = orjson.dumps({
+    'publishableKey': STRIPE_PUBLISHABLE_KEY,
+    'currency': STRIPE_CURRENCY,
+    'amount_cents': APPOINTMENT_PRICE_CENTS
+}, option=orjson.OPT_SORT_KEYS)
+_CONFIG_ETAG = hashlib.blake2b(_CONFIG_BODY, digest_size=8).hexdigest()
 
 @payments_bp.route('/payments/config', methods=['GET'])
 def payments_config():
     """Expose publishable key and pricing configuration to the frontend."""
-    return jsonify({
-        'publishableKey': STRIPE_PUBLISHABLE_KEY,
-        'currency': STRIPE_CURRENCY,
-        'amount_cents': APPOINTMENT_PRICE_CENTS
-    })
+    response = Response(_CONFIG_BODY, mimetype='application/json')
+    response.set_etag(_CONFIG_ETAG)
+    response.cache_control.public = True
+    response.cache_control.max_age = 300
+    # Answers If-None-Match revalidation with an empty 304
+    return response.make_conditional(request)
+
+def _parse_intent_request(raw_body: bytes):
+    """
+    Decode and type-check a create-intent request body in one pass.
+
+    Missing or malformed fields fall back to the configured defaults, as an
+    empty or unparsable body does.
+
+    Returns:
+        tuple: (amount_cents, currency, metadata)
+    """
+    try:
+        data = orjson.loads(raw_body) if raw_body else {}
+    except orjson.JSONDecodeError:
+        data = {}
+    if not isinstance(data, dict):
+        data = {}
+
+    amount_cents = data.get('amount_cents', APPOINTMENT_PRICE_CENTS)
+    if not isinstance(amount_cents, int):
+        try:
+            amount_cents = int(amount_cents)
+        except (TypeError, ValueError):
+            amount_cents = APPOINTMENT_PRICE_CENTS
+
+    currency = data.get('currency')
+    currency = currency.lower() if currency and isinstance(currency, str) else STRIPE_CURRENCY
+    metadata = data.get('metadata') or {}
+    return amount_cents, currency, metadata
+
+# Fixed error payloads, encoded once
+_STRIPE_NOT_CONFIGURED = PreEncodedJSON({
+    'error': 'stripe_not_configured',
+    'message': 'Stripe secret key is not configured on the server.'
+})
+_INVALID_AMOUNT = PreEncodedJSON({'error': 'invalid_amount', 'message': 'Amount must be a positive integer (cents).'})
+
+# Recently created intents by idempotency key, so a retried or double-submitted
+# request is answered without another Stripe round trip
+_INTENT_CACHE = TTLCache(maxsize=4096, ttl=600)
+_intent_cache_lock = threading.Lock()
 
 @payments_bp.route('/payments/create-intent', methods=['POST'])
 def create_payment_intent():
@@ -58,42 +132,56 @@ def create_payment_intent():
         "currency": "usd",             # optional; defaults to STRIPE_CURRENCY
         "metadata": { ... }             # optional metadata (patient, doctor, date, time)
     }
+
+    An Idempotency-Key header identifies retries of the same request and
+    returns the intent created by the first one; without it every request
+    creates a new intent.
     """
     if not STRIPE_SECRET_KEY:
-        return jsonify({
-            'error': 'stripe_not_configured',
-            'message': 'Stripe secret key is not configured on the server.'
-        }), 500
+        return jsonify(_STRIPE_NOT_CONFIGURED), 500
 
     try:
-        data = request.get_json(silent=True) or {}
-        amount_cents = _parse_int_env('APPOINTMENT_PRICE_CENTS', APPOINTMENT_PRICE_CENTS)
-        if 'amount_cents' in data:
-            try:
-                amount_cents = int(data.get('amount_cents'))
-            except (TypeError, ValueError):
-                pass
-        currency = (data.get('currency') or STRIPE_CURRENCY).lower()
-        metadata = data.get('metadata') or {}
+        raw_body = request.get_data(cache=False)
+        idempotency_key = request.headers.get('Idempotency-Key')
+        if idempotency_key:
+            body_digest = hashlib.blake2b(raw_body, digest_size=16).hexdigest()
+            with _intent_cache_lock:
+                cached = _INTENT_CACHE.get(idempotency_key)
+            # A reused key with a different body goes to Stripe, which rejects it
+            if cached and cached[0] == body_digest:
+                return jsonify(cached[1])
+
+        amount_cents, currency, metadata = _parse_intent_request(raw_body)
 
         # Basic guardrails
         if not isinstance(amount_cents, int) or amount_cents <= 0:
-            return jsonify({'error': 'invalid_amount', 'message': 'Amount must be a positive integer (cents).'}), 400
+            return jsonify(_INVALID_AMOUNT), 400
 
+        # Only client-supplied keys are forwarded; Stripe dedupes on them for 24h
+        request_options = {'idempotency_key': idempotency_key} if idempotency_key else {}
         intent = stripe.PaymentIntent.create(
             amount=amount_cents,
             currency=currency,
             automatic_payment_methods={'enabled': True},
-            metadata=metadata
+            metadata=metadata,
+            **request_options
         )
 
-        return jsonify({
+        payload = {
             'client_secret': intent.client_secret,
             'payment_intent_id': intent.id,
             'amount_cents': amount_cents,
             'currency': currency
-        })
+        }
+        if idempotency_key:
+            with _intent_cache_lock:
+                _INTENT_CACHE[idempotency_key] = (body_digest, payload)
+
+        return jsonify(payload)
 
+    except RequestEntityTooLarge:
+        # Body over MAX_CONTENT_LENGTH: let Flask answer 413
+        raise
     except stripe.error.StripeError as e:
         return jsonify({'error': 'stripe_error', 'message': str(e)}), 400
     except Exception as e:
@@ -1,87 +1,45 @@
 """
 Prediction endpoint for seizure risk assessment.
-Handles ML model loading, feature scaling, and prediction with natural language responses.
+Handles EEG feature input (JSON body or file upload) and returns natural language predictions.
 """
 
 from flask import Blueprint, request, jsonify
-import joblib
+from werkzeug.exceptions import RequestEntityTooLarge
 import numpy as np
-import random
+import orjson
+import io
 import os
-import json
 import re
 
-predict_bp = Blueprint('predict', __name__)
-
-# Natural language messages for different prediction outcomes
-SEIZURE_RISK_MESSAGES = [
-    "Warning: Seizure may occur soon. Stay safe and alert.",
-    "High seizure probability. Alert your caregiver if possible.",
-    "Critical: Seizure risk detected. Please take immediate precautions.",
-    "Danger: Brain activity indicates potential seizure. Seek medical attention.",
-    "Alert: Seizure warning active. Avoid dangerous activities.",
-    "Urgent: Seizure probability elevated. Contact your healthcare provider.",
-    "Warning: Abnormal brain patterns detected. Stay in safe environment.",
-    "High risk: Seizure indicators present. Take prescribed medication if available.",
-    "Critical alert: Seizure may be imminent. Lie down in safe area.",
-    "Emergency: Seizure risk confirmed. Call emergency services if needed."
-]
-
-NORMAL_EEG_MESSAGES = [
-    "Your brain activity looks stable.",
-    "No seizure indicators present at the moment.",
-    "EEG patterns appear normal and healthy.",
-    "Brain activity is within safe parameters.",
-    "No seizure risk detected in current readings.",
-    "Your neurological activity is stable.",
-    "EEG shows normal brain wave patterns.",
-    "No concerning brain activity detected.",
-    "Brain function appears to be normal.",
-    "Seizure risk assessment: Low probability."
-]
-
-# Global variables for model and scaler
-model = None
-scaler = None
-MODEL_PATH = None
-SCALER_PATH = None
+from services import predict as predict_service
+from utils.serialization import PreEncodedJSON, load_request_json
 
-def _resolve_model_paths():
-    """Resolve absolute filesystem paths for model and scaler."""
-    base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-    default_model = os.path.join(base_dir, 'models', 'best_mlp_model.joblib')
-    default_scaler = os.path.join(base_dir, 'models', 'mlp_scaler.joblib')
-    model_path = os.environ.get('MODEL_PATH', default_model)
-    scaler_path = os.environ.get('SCALER_PATH', default_scaler)
-    return model_path, scaler_path
-
-def load_model():
-    """Load the trained ML model and scaler from joblib files."""
-    global model, scaler, MODEL_PATH, SCALER_PATH
-
-    try:
-        model_path, scaler_path = _resolve_model_paths()
-        MODEL_PATH, SCALER_PATH = model_path, scaler_path
+predict_bp = Blueprint('predict', __name__)
 
-        if os.path.exists(model_path) and os.path.exists(scaler_path):
-            model = joblib.load(model_path)
-            scaler = joblib.load(scaler_path)
-            return True
-        else:
-            print(f"Model files not found. Expected: {model_path}, {scaler_path}")
-            return False
-    except Exception as e:
-        print(f"Error loading model: {str(e)}")
-        return False
+# Fixed error payloads, encoded once
+_INVALID_FILE_ENCODING = PreEncodedJSON({
+    "error": "Invalid file encoding",
+    "message": "Could not decode uploaded file as UTF-8"
+})
+_INVALID_FILE_CONTENT = PreEncodedJSON({
+    "error": "Invalid file content",
+    "message": "File must contain 115 numeric values (CSV, whitespace, or JSON array)"
+})
+_INVALID_INPUT = PreEncodedJSON({
+    "error": "Invalid input",
+    "message": "Provide 'features' JSON array or upload a file under field name 'file'"
+})
 
 @predict_bp.route('/predict/model/status', methods=['GET'])
 def model_status():
     """Return model loading status and file information for diagnostics."""
-    model_path, scaler_path = _resolve_model_paths()
+    # The model loads lazily; hitting this endpoint warms it in this worker
+    predict_service.load_model()
+    model_path, scaler_path = predict_service._resolve_model_paths()
     model_exists = os.path.exists(model_path)
     scaler_exists = os.path.exists(scaler_path)
     return jsonify({
-        "loaded": model is not None and scaler is not None,
+        "loaded": predict_service.model_loaded(),
         "model_path": model_path,
         "scaler_path": scaler_path,
         "model_exists": model_exists,
@@ -108,14 +66,6 @@ def predict_seizure():
     }
     """
     
-    # Load model if not already loaded
-    if model is None or scaler is None:
-        if not load_model():
-            return jsonify({
-                "error": "Model not available",
-                "message": "ML model files could not be loaded"
-            }), 500
-    
     try:
         # Attempt to extract features from either a file upload or JSON body
         features = None
@@ -124,89 +74,55 @@ def predict_seizure():
         if 'file' in request.files:
             uploaded_file = request.files['file']
             try:
-                raw_text = uploaded_file.read().decode('utf-8', errors='ignore')
+                raw_bytes = uploaded_file.read()
             except Exception:
-                return jsonify({
-                    "error": "Invalid file encoding",
-                    "message": "Could not decode uploaded file as UTF-8"
-                }), 400
+                return jsonify(_INVALID_FILE_ENCODING), 400
 
-            # Try JSON array first
             parsed = None
-            try:
-                parsed_json = json.loads(raw_text)
-                if isinstance(parsed_json, list):
-                    parsed = parsed_json
-            except Exception:
-                parsed = None
+            stripped = raw_bytes.strip()
+            if stripped[:1] in (b'[', b'{'):
+                # Try JSON array first
+                try:
+                    parsed_json = orjson.loads(raw_bytes)
+                    if isinstance(parsed_json, list):
+                        parsed = parsed_json
+                except Exception:
+                    parsed = None
+            elif stripped:
+                # Comma/newline separated numbers, tokenized in C straight into an array
+                try:
+                    parsed = np.loadtxt(io.BytesIO(raw_bytes), delimiter=',', comments=None,
+                                        dtype=predict_service.PREDICT_DTYPE, ndmin=1).ravel()
+                except ValueError:
+                    parsed = None
 
             if parsed is None:
                 # Fallback: parse as CSV/whitespace separated numbers
+                raw_text = raw_bytes.decode('utf-8', errors='ignore')
                 tokens = re.split(r'[\s,;]+', raw_text.strip()) if raw_text.strip() else []
                 try:
                     parsed = [float(t) for t in tokens if t != '']
                 except ValueError:
-                    return jsonify({
-                        "error": "Invalid file content",
-                        "message": "File must contain 115 numeric values (CSV, whitespace, or JSON array)"
-                    }), 400
+                    return jsonify(_INVALID_FILE_CONTENT), 400
 
             features = parsed
 
         else:
             # 2) JSON body { "features": [...] }
-            data = request.get_json(silent=True)
-            if data and 'features' in data:
+            data = load_request_json()
+            if isinstance(data, dict) and 'features' in data:
                 features = data['features']
             else:
-                return jsonify({
-                    "error": "Invalid input",
-                    "message": "Provide 'features' JSON array or upload a file under field name 'file'"
-                }), 400
-        
-        # Validate input
-        if not isinstance(features, list) or len(features) != 115:
-            return jsonify({
-                "error": "Invalid features",
-                "message": "Features must be an array of exactly 115 float values"
-            }), 400
-        
-        # Convert to numpy array and reshape
-        features_array = np.array(features, dtype=float).reshape(1, -1)
-        
-        # Scale features
-        features_scaled = scaler.transform(features_array)
-        
-        # Make prediction
-        prediction = model.predict(features_scaled)[0]
-        confidence = model.predict_proba(features_scaled)[0].max()
-        
-        # Generate response
-        if prediction == 1:  # Seizure risk detected
-            status = "High seizure risk"
-            message = random.choice(SEIZURE_RISK_MESSAGES)
-        else:  # Normal EEG
-            status = "Normal EEG pattern"
-            message = random.choice(NORMAL_EEG_MESSAGES)
-        
-        return jsonify({
-            "status": status,
-            "confidence": float(confidence),
-            "message": message,
-            "prediction": int(prediction)
-        })
-        
-    except ValueError as e:
-        return jsonify({
-            "error": "Invalid data format",
-            "message": "Features must contain valid numeric values"
-        }), 400
+                return jsonify(_INVALID_INPUT), 400
         
+    except RequestEntityTooLarge:
+        # Body over MAX_CONTENT_LENGTH: let Flask answer 413
+        raise
     except Exception as e:
         return jsonify({
             "error": "Prediction failed",
             "message": f"An error occurred during prediction: {str(e)}"
         }), 500
-
-# Load model on module import
-load_model() 
\ No newline at end of file
+    
+    payload, status = predict_service.predict_seizure(features)
+    return jsonify(payload), status
@@ -0,0 +1 @@
+# Services package for core API logic shared by the API and frontend routes 
\ No newline at end of file
@@ -0,0 +1,240 @@
+"""
+Appointment service for managing doctor appointments.
+Core booking and retrieval logic shared by the API and frontend routes.
+"""
+
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import date, datetime, time
+from operator import itemgetter
+import secrets
+import threading
+
+# In-memory storage for appointments (in production, use database),
+# kept sorted by (date, time) so listings never need a full sort
+appointments_db = []
+_sort_keys = []  # (date, time) for each entry of appointments_db, same order
+
+# Lookup indexes: id -> appointment, lowercased name / status -> appointment ids
+_by_id = {}
+_by_patient = defaultdict(set)
+_by_doctor = defaultdict(set)
+_by_status = defaultdict(set)
+_lock = threading.Lock()
+
+_appointment_order = itemgetter('date', 'time', 'created_at')
+
+def _store_appointment(appointment):
+    """Insert an appointment in (date, time) order and register it in the indexes."""
+    sort_key = (appointment['date'], appointment['time'])
+    with _lock:
+        position = bisect_right(_sort_keys, sort_key)
+        _sort_keys.insert(position, sort_key)
+        appointments_db.insert(position, appointment)
+        
+        appointment_id = appointment['id']
+        _by_id[appointment_id] = appointment
+        _by_patient[appointment['patient'].lower()].add(appointment_id)
+        _by_doctor[appointment['doctor'].lower()].add(appointment_id)
+        _by_status[appointment['status']].add(appointment_id)
+
+def _ids_matching(index, name_filter):
+    """Union the id sets of every indexed name containing name_filter."""
+    name_filter = name_filter.lower()
+    matched = set()
+    for name, ids in index.items():
+        if name_filter in name:
+            matched |= ids
+    return matched
+
+def book_appointment(data):
+    """
+    Book a new doctor appointment.
+    
+    Args:
+        data: Request payload with patient, doctor, date and time
+        
+    Returns:
+        tuple: (response dict, HTTP status code)
+    """
+    
+    try:
+        # Validate required fields
+        required_fields = ['patient', 'doctor', 'date', 'time']
+        for field in required_fields:
+            if not data or field not in data:
+                return {
+                    "error": "Missing required field",
+                    "message": f"Field '{field}' is required"
+                }, 400
+        
+        patient = data['patient'].strip()
+        doctor = data['doctor'].strip()
+        date_str = data['date']
+        time_str = data['time']
+        
+        # Validate patient and doctor names
+        if not patient or not doctor:
+            return {
+                "error": "Invalid input",
+                "message": "Patient and doctor names cannot be empty"
+            }, 400
+        
+        # Validate date format (fromisoformat accepts other ISO forms, so
+        # require the canonical YYYY-MM-DD spelling to round-trip)
+        try:
+            appointment_date = date.fromisoformat(date_str)
+            if appointment_date.isoformat() != date_str:
+                raise ValueError(date_str)
+            if appointment_date < date.today():
+                return {
+                    "error": "Invalid date",
+                    "message": "Appointment date cannot be in the past"
+                }, 400
+        except ValueError:
+            return {
+                "error": "Invalid date format",
+                "message": "Date must be in YYYY-MM-DD format"
+            }, 400
+        
+        # Validate time format
+        try:
+            if time.fromisoformat(time_str).isoformat(timespec='minutes') != time_str:
+                raise ValueError(time_str)
+        except ValueError:
+            return {
+                "error": "Invalid time format", 
+                "message": "Time must be in HH:MM format (24-hour)"
+            }, 400
+        
+        # Create appointment object
+        appointment_id = secrets.token_hex(16)
+        appointment = {
+            "id": appointment_id,
+            "patient": patient,
+            "doctor": doctor,
+            "date": date_str,
+            "time": time_str,
+            "status": "scheduled",
+            "created_at": datetime.now().isoformat()
+        }
+        
+        # Store appointment
+        _store_appointment(appointment)
+        
+        return {
+            "status": "success",
+            "message": "Appointment booked successfully",
+            "appointment_id": appointment_id,
+            "appointment": appointment
+        }, 201
+        
+    except Exception as e:
+        return {
+            "error": "Booking failed",
+            "message": f"An error occurred while booking appointment: {str(e)}"
+        }, 500
+
+def get_appointments(patient_filter='', doctor_filter='', status_filter=''):
+    """
+    Retrieve appointments, optionally filtered.
+    
+    Args:
+        patient_filter: Case-insensitive substring of the patient name
+        doctor_filter: Case-insensitive substring of the doctor name
+        status_filter: Exact appointment status
+        
+    Returns:
+        tuple: (response dict, HTTP status code)
+    """
+    
+    try:
+        with _lock:
+            if not (patient_filter or doctor_filter or status_filter):
+                # Already in (date, time) order; a slice snapshots it so later
+                # inserts cannot change the list while it is serialized
+                filtered_appointments = appointments_db[:]
+            else:
+                # Narrow down to candidate ids through the indexes, then
+                # materialize and order only the matching appointments
+                candidate_sets = []
+                if patient_filter:
+                    candidate_sets.append(_ids_matching(_by_patient, patient_filter))
+                if doctor_filter:
+                    candidate_sets.append(_ids_matching(_by_doctor, doctor_filter))
+                if status_filter:
+                    candidate_sets.append(_by_status.get(status_filter.lower(), set()))
+                
+                matching_ids = set.intersection(*candidate_sets)
+                filtered_appointments = sorted(
+                    (_by_id[appointment_id] for appointment_id in matching_ids),
+                    key=_appointment_order
+                )
+            total = len(filtered_appointments)
+        
+        return {
+            "status": "success",
+            "appointments": filtered_appointments,
+            "total": total
+        }, 200
+        
+    except Exception as e:
+        return {
+            "error": "Retrieval failed",
+            "message": f"An error occurred while retrieving appointments: {str(e)}"
+        }, 500
+
+def update_appointment(appointment_id, data):
+    """
+    Update appointment status.
+    
+    Args:
+        appointment_id: ID of the appointment to update
+        data: Request payload with the new status
+        
+    Returns:
+        tuple: (response dict, HTTP status code)
+    """
+    
+    try:
+        if not data or 'status' not in data:
+            return {
+                "error": "Missing status",
+                "message": "Status field is required"
+            }, 400
+        
+        new_status = data['status'].lower()
+        valid_statuses = ['scheduled', 'completed', 'cancelled', 'rescheduled']
+        
+        if new_status not in valid_statuses:
+            return {
+                "error": "Invalid status",
+                "message": f"Status must be one of: {', '.join(valid_statuses)}"
+            }, 400
+        
+        # Find and update appointment
+        with _lock:
+            appointment = _by_id.get(appointment_id)
+            if appointment is not None:
+                _by_status[appointment['status']].discard(appointment_id)
+                _by_status[new_status].add(appointment_id)
+                appointment['status'] = new_status
+                appointment['updated_at'] = datetime.now().isoformat()
+        
+        if appointment is None:
+            return {
+                "error": "Appointment not found",
+                "message": f"No appointment found with ID: {appointment_id}"
+            }, 404
+        
+        return {
+            "status": "success",
+            "message": "Appointment updated successfully",
+            "appointment": appointment
+        }, 200
+        
+    except Exception as e:
+        return {
+            "error": "Update failed",
+            "message": f"An error occurred while updating appointment: {str(e)}"
+        }, 500
@@ -0,0 +1,108 @@
+"""
+Micro-batching helper for ML inference.
+Coalesces concurrent single-row prediction requests into one matrix call.
+"""
+
+import queue
+import threading
+import time
+
+import numpy as np
+
+class _PendingRow:
+    """A submitted row waiting for its batched result."""
+    
+    __slots__ = ('row', 'event', 'result', 'error')
+    
+    def __init__(self, row):
+        self.row = row
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+class MicroBatcher:
+    """
+    Run a row-wise inference function over batches of concurrent requests.
+    
+    Rows submitted while another inference is in progress are queued for a
+    background worker thread, which drains up to max_batch of them (waiting at
+    most max_wait_ms for more to arrive), stacks them into one matrix and calls
+    batch_fn once. When the batcher is idle the caller runs batch_fn inline.
+    
+    batch_fn takes an (N, n_features) array and returns a tuple of length-N
+    arrays; each caller receives the tuple of its own row's values.
+    """
+    
+    def __init__(self, batch_fn, max_batch=64, max_wait_ms=5, timeout=10.0):
+        self._batch_fn = batch_fn
+        self._max_batch = max_batch
+        self._max_wait = max_wait_ms / 1000.0
+        self._timeout = timeout
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker = None
+        self._worker_lock = threading.Lock()
+    
+    def submit(self, row):
+        """
+        Run batch_fn for a single feature row.
+        
+        Args:
+            row: 1-D numpy array of features
+            
+        Returns:
+            tuple: This row's value from each array returned by batch_fn
+        """
+        # Fast path: nothing else in flight, run inline without a thread hop
+        if self._queue.empty() and self._lock.acquire(blocking=False):
+            try:
+                results = self._batch_fn(row[np.newaxis, :])
+            finally:
+                self._lock.release()
+            return tuple(column[0] for column in results)
+        
+        pending = _PendingRow(row)
+        self._ensure_worker()
+        self._queue.put(pending)
+        if not pending.event.wait(self._timeout):
+            raise TimeoutError("Timed out waiting for batched prediction")
+        if pending.error is not None:
+            raise pending.error
+        return pending.result
+    
+    def _ensure_worker(self):
+        """Start the worker thread on first use (and again in forked workers)."""
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name='predict-batcher', daemon=True)
+                self._worker.start()
+    
+    def _collect_batch(self):
+        """Block for one row, then gather more until the batch is full or the wait expires."""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self._max_wait
+        while len(batch) < self._max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+    
+    def _run(self):
+        """Worker loop: run batch_fn once per collected batch and wake the callers."""
+        while True:
+            batch = self._collect_batch()
+            try:
+                with self._lock:
+                    results = self._batch_fn(np.vstack([pending.row for pending in batch]))
+                for index, pending in enumerate(batch):
+                    pending.result = tuple(column[index] for column in results)
+            except Exception as e:
+                for pending in batch:
+                    pending.error = e
+            finally:
+                for pending in batch:
+                    pending.event.set()
@@ -0,0 +1,333 @@
+"""
+Medication service for managing medication schedules.
+Core scheduling logic shared by the API and frontend routes.
+"""
+
+from datetime import datetime
+import re
+import uuid
+
+import orjson
+
+from services.store import SQLiteStore
+from utils.serialization import PreEncodedJSON
+
+# Medication schedules (SQLite; in-memory unless STORE_DB_PATH is set).
+# patient_lc backs the case-insensitive patient filter, times is a JSON array.
+_store = SQLiteStore("""
+    CREATE TABLE IF NOT EXISTS medications (
+        id TEXT PRIMARY KEY,
+        patient TEXT NOT NULL,
+        patient_lc TEXT NOT NULL,
+        drug_name TEXT NOT NULL,
+        times TEXT NOT NULL,
+        dosage TEXT NOT NULL,
+        instructions TEXT NOT NULL,
+        status TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT
+    );
+    CREATE INDEX IF NOT EXISTS medications_order ON medications (patient, drug_name, created_at);
+    CREATE INDEX IF NOT EXISTS medications_patient ON medications (patient_lc);
+    CREATE INDEX IF NOT EXISTS medications_status ON medications (status);
+""")
+
+_INSERT_MEDICATION = (
+    "INSERT INTO medications (id, patient, patient_lc, drug_name, times, dosage, instructions, status, created_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_SELECT_MEDICATION = "SELECT * FROM medications WHERE id = ?"
+_UPDATE_MEDICATION = (
+    "UPDATE medications SET times = ?, dosage = ?, instructions = ?, status = ?, updated_at = ? WHERE id = ?"
+)
+_DELETE_MEDICATION = "DELETE FROM medications WHERE id = ?"
+_MEDICATION_ORDER = " ORDER BY patient, drug_name, created_at"
+
+def _row_to_medication(row):
+    """Convert a medications row to the API's medication dict."""
+    medication = {
+        "id": row['id'],
+        "patient": row['patient'],
+        "drug_name": row['drug_name'],
+        "times": orjson.loads(row['times']),
+        "dosage": row['dosage'],
+        "instructions": row['instructions'],
+        "status": row['status'],
+        "created_at": row['created_at']
+    }
+    if row['updated_at'] is not None:
+        medication['updated_at'] = row['updated_at']
+    return medication
+
+def _medication_not_found(medication_id):
+    """404 response for an unknown medication id."""
+    return {
+        "error": "Medication not found",
+        "message": f"No medication found with ID: {medication_id}"
+    }, 404
+
+# Fixed error payloads, encoded once
+_VALID_STATUSES = ['active', 'paused', 'discontinued']
+_MISSING_FIELD = {
+    field: PreEncodedJSON({
+        "error": "Missing required field",
+        "message": f"Field '{field}' is required"
+    })
+    for field in ('patient', 'drug_name', 'times')
+}
+_EMPTY_NAMES = PreEncodedJSON({
+    "error": "Invalid input",
+    "message": "Patient and drug names cannot be empty"
+})
+_INVALID_TIMES = PreEncodedJSON({
+    "error": "Invalid times",
+    "message": "Times must be a non-empty array of time strings"
+})
+_INVALID_UPDATE_TIMES = PreEncodedJSON({
+    "error": "Invalid times",
+    "message": "Times must be a non-empty array"
+})
+_NO_DATA = PreEncodedJSON({
+    "error": "No data provided",
+    "message": "Please provide data to update"
+})
+_INVALID_STATUS = PreEncodedJSON({
+    "error": "Invalid status",
+    "message": f"Status must be one of: {', '.join(_VALID_STATUSES)}"
+})
+
+# 24-hour HH:MM dose time (matched whole, ASCII digits only)
+_HHMM_RE = re.compile(r'([01][0-9]|2[0-3]):[0-5][0-9]')
+
+def _invalid_time(times):
+    """Return the first entry of times that is not an HH:MM string, or None."""
+    for time_str in times:
+        if not isinstance(time_str, str) or not _HHMM_RE.fullmatch(time_str):
+            return time_str
+    return None
+
+def schedule_medication(data):
+    """
+    Schedule medication for a patient.
+    
+    Args:
+        data: Request payload with patient, drug_name, times and optional dosage/instructions
+        
+    Returns:
+        tuple: (response dict, HTTP status code)
+    """
+    
+    try:
+        # Validate required fields
+        for field in _MISSING_FIELD:
+            if not data or field not in data:
+                return _MISSING_FIELD[field], 400
+        
+        patient = data['patient'].strip()
+        drug_name = data['drug_name'].strip()
+        times = data['times']
+        dosage = data.get('dosage', '').strip()
+        instructions = data.get('instructions', '').strip()
+        
+        # Validate patient and drug names
+        if not patient or not drug_name:
+            return _EMPTY_NAMES, 400
+        
+        # Validate times array
+        if not isinstance(times, list) or len(times) == 0:
+            return _INVALID_TIMES, 400
+        
+        # Validate time format for each time
+        invalid_time = _invalid_time(times)
+        if invalid_time is not None:
+            return {
+                "error": "Invalid time format",
+                "message": f"Time '{invalid_time}' must be in HH:MM format (24-hour)"
+            }, 400
+        
+        # Sort times chronologically
+        times.sort()
+        
+        # Create medication schedule object
+        medication_id = str(uuid.uuid4())
+        medication = {
+            "id": medication_id,
+            "patient": patient,
+            "drug_name": drug_name,
+            "times": times,
+            "dosage": dosage,
+            "instructions": instructions,
+            "status": "active",
+            "created_at": datetime.now().isoformat()
+        }
+        
+        # Store medication schedule
+        with _store as conn:
+            conn.execute(_INSERT_MEDICATION, (
+                medication_id, patient, patient.lower(), drug_name, orjson.dumps(times).decode('utf-8'),
+                dosage, instructions, medication['status'], medication['created_at']
+            ))
+        
+        return {
+            "status": "success",
+            "message": "Medication scheduled successfully",
+            "medication_id": medication_id,
+            "medication": medication
+        }, 201
+        
+    except Exception as e:
+        return {
+            "error": "Scheduling failed",
+            "message": f"An error occurred while scheduling medication: {str(e)}"
+        }, 500
+
+def get_medications(patient_filter='', status_filter=''):
+    """
+    Retrieve medication schedules, optionally filtered.
+    
+    Args:
+        patient_filter: Case-insensitive substring of the patient name
+        status_filter: Medication status (case-insensitive)
+        
+    Returns:
+        tuple: (response dict, HTTP status code)
+    """
+    
+    try:
+        # Filter in SQL; rows come back sorted by patient name and drug name
+        conditions, params = [], []
+        if patient_filter:
+            conditions.append("instr(patient_lc, ?) > 0")
+            params.append(patient_filter.lower())
+        if status_filter:
+            conditions.append("status = ?")
+            params.append(status_filter.lower())
+        
+        query = "SELECT * FROM medications"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        
+        with _store as conn:
+            rows = conn.execute(query + _MEDICATION_ORDER, params).fetchall()
+        filtered_medications = [_row_to_medication(row) for row in rows]
+        
+        return {
+            "status": "success",
+            "medications": filtered_medications,
+            "total": len(filtered_medications)
+        }, 200
+        
+    except Exception as e:
+        return {
+            "error": "Retrieval failed",
+            "message": f"An error occurred while retrieving medications: {str(e)}"
+        }, 500
+
+def update_medication(medication_id, data):
+    """
+    Update medication schedule.
+    
+    Args:
+        medication_id: ID of the medication schedule to update
+        data: Request payload with the fields to update
+        
+    Returns:
+        tuple: (response dict, HTTP status code)
+    """
+    
+    try:
+        if not data:
+            return _NO_DATA, 400
+        
+        # Read, modify and write back in one locked transaction, so concurrent
+        # updates (from any worker) cannot overwrite each other's fields
+        with _store as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(_SELECT_MEDICATION, (medication_id,)).fetchone()
+            medication = _row_to_medication(row) if row else None
+            
+            if not medication:
+                return _medication_not_found(medication_id)
+            
+            # Update fields if provided
+            if 'times' in data:
+                times = data['times']
+                if not isinstance(times, list) or len(times) == 0:
+                    return _INVALID_UPDATE_TIMES, 400
+                
+                # Validate time format
+                invalid_time = _invalid_time(times)
+                if invalid_time is not None:
+                    return {
+                        "error": "Invalid time format",
+                        "message": f"Time '{invalid_time}' must be in HH:MM format"
+                    }, 400
+                
+                medication['times'] = sorted(times)
+            
+            if 'dosage' in data:
+                medication['dosage'] = data['dosage'].strip()
+            
+            if 'instructions' in data:
+                medication['instructions'] = data['instructions'].strip()
+            
+            if 'status' in data:
+                new_status = data['status'].lower()
+                
+                if new_status not in _VALID_STATUSES:
+                    return _INVALID_STATUS, 400
+                
+                medication['status'] = new_status
+            
+            medication['updated_at'] = datetime.now().isoformat()
+            
+            updated = conn.execute(_UPDATE_MEDICATION, (
+                orjson.dumps(medication['times']).decode('utf-8'), medication['dosage'],
+                medication['instructions'], medication['status'], medication['updated_at'], medication_id
+            )).rowcount
+        
+        # Deleted between the read and the write
+        if not updated:
+            return _medication_not_found(medication_id)
+        
+        return {
+            "status": "success",
+            "message": "Medication updated successfully",
+            "medication": medication
+        }, 200
+        
+    except Exception as e:
+        return {
+            "error": "Update failed",
+            "message": f"An error occurred while updating medication: {str(e)}"
+        }, 500
+
+def delete_medication(medication_id):
+    """
+    Delete medication schedule.
+    
+    Args:
+        medication_id: ID of the medication schedule to delete
+        
+    Returns:
+        tuple: (response dict, HTTP status code)
+    """
+    
+    try:
+        # Find and remove medication
+        with _store as conn:
+            deleted = conn.execute(_DELETE_MEDICATION, (medication_id,)).rowcount
+        
+        if not deleted:
+            return _medication_not_found(medication_id)
+        
+        return {
+            "status": "success",
+            "message": "Medication deleted successfully"
+        }, 200
+        
+    except Exception as e:
+        return {
+            "error": "Deletion failed",
+            "message": f"An error occurred while deleting medication: {str(e)}"
+        }, 500 
\ No newline at end of file
@@ -0,0 +1,311 @@
+"""
+Prediction service for seizure risk assessment.
+Handles ML model loading, feature scaling, and prediction with natural language responses.
+"""
+
+import joblib
+import numpy as np
+from scipy.special import expit
+from sklearn.neural_network import MLPClassifier
+from sklearn.preprocessing import StandardScaler
+import random
+import os
+import threading
+
+from services.batching import MicroBatcher
+from utils.serialization import PreEncodedJSON
+
+# Optional: numba compiles the ReLU forward pass into a single native call
+try:
+    from numba import njit
+    from numba.typed import List as NumbaList
+except ImportError:
+    njit = None
+
+# Natural language messages for different prediction outcomes
+SEIZURE_RISK_MESSAGES = (
+    "Warning: Seizure may occur soon. Stay safe and alert.",
+    "High seizure probability. Alert your caregiver if possible.",
+    "Critical: Seizure risk detected. Please take immediate precautions.",
+    "Danger: Brain activity indicates potential seizure. Seek medical attention.",
+    "Alert: Seizure warning active. Avoid dangerous activities.",
+    "Urgent: Seizure probability elevated. Contact your healthcare provider.",
+    "Warning: Abnormal brain patterns detected. Stay in safe environment.",
+    "High risk: Seizure indicators present. Take prescribed medication if available.",
+    "Critical alert: Seizure may be imminent. Lie down in safe area.",
+    "Emergency: Seizure risk confirmed. Call emergency services if needed."
+)
+
+NORMAL_EEG_MESSAGES = (
+    "Your brain activity looks stable.",
+    "No seizure indicators present at the moment.",
+    "EEG patterns appear normal and healthy.",
+    "Brain activity is within safe parameters.",
+    "No seizure risk detected in current readings.",
+    "Your neurological activity is stable.",
+    "EEG shows normal brain wave patterns.",
+    "No concerning brain activity detected.",
+    "Brain function appears to be normal.",
+    "Seizure risk assessment: Low probability."
+)
+
+# Private generator for message selection (not shared with the global random state)
+_RNG = random.Random()
+
+# In-place hidden layer activations, as named by MLPClassifier.activation
+_ACTIVATIONS = {
+    'identity': lambda z: z,
+    'relu': lambda z: np.maximum(z, 0, out=z),
+    'tanh': lambda z: np.tanh(z, out=z),
+    'logistic': lambda z: expit(z, out=z),
+}
+
+# Inference precision; float32 halves the bytes moved per matmul,
+# set PREDICT_DTYPE=float64 to reproduce sklearn's arithmetic exactly
+PREDICT_DTYPE = np.dtype(os.environ.get('PREDICT_DTYPE', 'float32'))
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _relu_logits_jit(features_matrix, weights, biases):
+        """Forward pass of a ReLU MLP up to the output logits."""
+        z = features_matrix
+        last = len(weights) - 1
+        for layer in range(last):
+            z = np.maximum(z @ weights[layer] + biases[layer], 0)
+        return z @ weights[last] + biases[last]
+
+# Fixed error payloads, encoded once
+_MODEL_NOT_AVAILABLE = PreEncodedJSON({
+    "error": "Model not available",
+    "message": "ML model files could not be loaded"
+})
+_INVALID_FEATURES = PreEncodedJSON({
+    "error": "Invalid features",
+    "message": "Features must be an array of exactly 115 float values"
+})
+_INVALID_DATA_FORMAT = PreEncodedJSON({
+    "error": "Invalid data format",
+    "message": "Features must contain valid numeric values"
+})
+
+# Micro-batching of concurrent predictions
+BATCH_MAX = int(os.environ.get('PREDICT_BATCH_MAX', '64'))
+BATCH_WAIT_MS = float(os.environ.get('PREDICT_BATCH_WAIT_MS', '5'))
+
+def _resolve_model_paths():
+    """Resolve absolute filesystem paths for model and scaler."""
+    base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    default_model = os.path.join(base_dir, 'models', 'best_mlp_model.joblib')
+    default_scaler = os.path.join(base_dir, 'models', 'mlp_scaler.joblib')
+    model_path = os.environ.get('MODEL_PATH', default_model)
+    scaler_path = os.environ.get('SCALER_PATH', default_scaler)
+    return model_path, scaler_path
+
+# Inference kernel for the loaded model, built on first use in each process
+_kernel = None
+_kernel_lock = threading.Lock()
+
+def _load_bundle():
+    """
+    Load the trained model and scaler.
+    
+    The joblib files are memory-mapped read-only, so forked workers share
+    the model's arrays through the page cache instead of private copies.
+    
+    Returns:
+        tuple: (model, scaler)
+    """
+    model_path, scaler_path = _resolve_model_paths()
+    if not (os.path.exists(model_path) and os.path.exists(scaler_path)):
+        raise FileNotFoundError(f"Expected: {model_path}, {scaler_path}")
+    return joblib.load(model_path, mmap_mode='r'), joblib.load(scaler_path, mmap_mode='r')
+
+def model_loaded():
+    """Whether the model is loaded and its inference kernel built in this process."""
+    return _kernel is not None
+
+def load_model():
+    """Load the trained ML model and scaler (and build the inference kernel), reporting whether it succeeded."""
+    try:
+        _get_kernel()
+        return True
+    except FileNotFoundError as e:
+        print(f"Model files not found. {str(e)}")
+        return False
+    except Exception as e:
+        print(f"Error loading model: {str(e)}")
+        return False
+
+def _sklearn_kernel(model, scaler):
+    """Generic inference through the sklearn estimators."""
+    
+    def infer(features_matrix):
+        features_scaled = scaler.transform(features_matrix)
+        probabilities = model.predict_proba(features_scaled)
+        # Same class as model.predict, without a second forward pass
+        predictions = model.classes_[probabilities.argmax(axis=1)]
+        return predictions, probabilities.max(axis=1)
+    
+    return infer
+
+def _build_kernel(model, scaler):
+    """
+    Build the inference function for a loaded model bundle.
+    
+    For a StandardScaler + MLPClassifier pair the scaler is folded into the
+    first layer's weights and the forward pass runs as plain numpy matmuls
+    (or one numba-compiled call for ReLU networks when numba is installed),
+    skipping sklearn's input validation and per-call dispatch. Any other
+    estimator falls back to scaler.transform + model.predict_proba.
+    
+    Args:
+        model: Fitted classifier
+        scaler: Fitted feature scaler
+        
+    Returns:
+        callable: (n_rows, n_features) array -> (predicted classes, confidences)
+    """
+    binary = getattr(model, 'n_outputs_', None) == 1 and getattr(model, 'out_activation_', None) == 'logistic'
+    multiclass = getattr(model, 'out_activation_', None) == 'softmax'
+    if not (isinstance(model, MLPClassifier) and isinstance(scaler, StandardScaler)
+            and model.activation in _ACTIVATIONS and (binary or multiclass)):
+        return _sklearn_kernel(model, scaler)
+    
+    # (x - mean) / scale @ W0 + b0  ==  x @ (W0 / scale[:, None]) + (b0 - (mean / scale) @ W0)
+    mean = scaler.mean_ if scaler.with_mean else 0.0
+    inv_scale = 1.0 / scaler.scale_ if scaler.with_std else np.ones(model.coefs_[0].shape[0])
+    weights = [model.coefs_[0] * inv_scale[:, np.newaxis]] + list(model.coefs_[1:])
+    biases = [model.intercepts_[0] - (mean * inv_scale) @ model.coefs_[0]] + list(model.intercepts_[1:])
+    weights = [np.ascontiguousarray(W, dtype=PREDICT_DTYPE) for W in weights]
+    biases = [np.ascontiguousarray(b, dtype=PREDICT_DTYPE) for b in biases]
+    activation = _ACTIVATIONS[model.activation]
+    classes = model.classes_
+    
+    # Everything the per-batch closures touch is bound here once, so the hot
+    # path runs on closure cells instead of global/attribute lookups and
+    # does not re-slice the layer lists on every call
+    hidden_layers = tuple(zip(weights[:-1], biases[:-1]))
+    output_weights, output_bias = weights[-1], biases[-1]
+    ascontiguousarray, where, exp, sigmoid = np.ascontiguousarray, np.where, np.exp, expit
+    intp, dtype = np.intp, PREDICT_DTYPE
+    
+    def numpy_logits(features_matrix):
+        z = features_matrix
+        for W, b in hidden_layers:
+            z = z @ W
+            z += b
+            z = activation(z)
+        logits = z @ output_weights
+        logits += output_bias
+        return logits
+    
+    forward = numpy_logits
+    if njit is not None and model.activation == 'relu':
+        jit_weights, jit_biases = NumbaList(weights), NumbaList(biases)
+        relu_logits = _relu_logits_jit
+        
+        def jit_logits(features_matrix):
+            return relu_logits(ascontiguousarray(features_matrix, dtype=dtype), jit_weights, jit_biases)
+        
+        try:
+            # Compile (or load from numba's on-disk cache) now, not on the first request
+            jit_logits(np.zeros((1, weights[0].shape[0]), dtype=dtype))
+            forward = jit_logits
+        except Exception as e:
+            print(f"Numba forward pass unavailable, using numpy: {str(e)}")
+    
+    def infer(features_matrix):
+        logits = forward(features_matrix)
+        
+        if binary:
+            # predict_proba would be [1 - p, p]; argmax picks class 1 only when p > 0.5
+            p = sigmoid(logits[:, 0])
+            positive = p > 0.5
+            return classes[positive.astype(intp)], where(positive, p, 1.0 - p)
+        
+        # Softmax max probability is 1 / sum(exp(logits - max logit))
+        logits -= logits.max(axis=1, keepdims=True)
+        return classes[logits.argmax(axis=1)], 1.0 / exp(logits).sum(axis=1)
+    
+    return infer
+
+def _get_kernel():
+    """
+    Inference function for the model, loaded and built once per process.
+    
+    Loading the bundle, folding the weights and any numba compile all run
+    under one lock, so concurrent first requests wait for a single build.
+    """
+    global _kernel
+    
+    if _kernel is None:
+        with _kernel_lock:
+            # Another thread may have finished building while we waited
+            if _kernel is None:
+                _kernel = _build_kernel(*_load_bundle())
+    return _kernel
+
+def _predict_batch(features_matrix):
+    """
+    Scale and classify a batch of feature rows in one model call.
+    
+    Args:
+        features_matrix: numpy array of shape (n_rows, 115)
+        
+    Returns:
+        tuple: (predicted classes, confidence of each prediction)
+    """
+    return _get_kernel()(features_matrix)
+
+_batcher = MicroBatcher(_predict_batch, max_batch=BATCH_MAX, max_wait_ms=BATCH_WAIT_MS)
+
+def predict_seizure(features):
+    """
+    Predict seizure risk based on EEG features.
+    
+    Args:
+        features: Sequence (or 1-D array) of 115 float values representing EEG features
+        
+    Returns:
+        tuple: (response dict, HTTP status code)
+    """
+    
+    # Model files missing or unreadable: the load is retried on the next request
+    if not model_loaded():
+        if not load_model():
+            return _MODEL_NOT_AVAILABLE, 500
+    
+    try:
+        # Coerce and validate in one pass; reject NaN/inf here so one bad row cannot fail a shared batch
+        features_array = np.asarray(features, dtype=PREDICT_DTYPE)
+        if features_array.shape != (115,):
+            return _INVALID_FEATURES, 400
+        if not np.isfinite(features_array).all():
+            raise ValueError("Features contain non-finite values")
+        
+        # Scale and predict, batched with concurrent requests
+        prediction, confidence = _batcher.submit(features_array)
+        
+        # Generate response
+        if prediction == 1:  # Seizure risk detected
+            status = "High seizure risk"
+            message = SEIZURE_RISK_MESSAGES[_RNG.randrange(len(SEIZURE_RISK_MESSAGES))]
+        else:  # Normal EEG
+            status = "Normal EEG pattern"
+            message = NORMAL_EEG_MESSAGES[_RNG.randrange(len(NORMAL_EEG_MESSAGES))]
+        
+        return {
+            "status": status,
+            "confidence": float(confidence),
+            "message": message,
+            "prediction": int(prediction)
+        }, 200
+        
+    except (TypeError, ValueError) as e:
+        return _INVALID_DATA_FORMAT, 400
+        
+    except Exception as e:
+        return {
+            "error": "Prediction failed",
+            "message": f"An error occurred during prediction: {str(e)}"
+        }, 500
@@ -0,0 +1,385 @@
+"""
+Progress service for tracking seizure logs and treatment progress.
+Core logging and trend analysis logic shared by the API and frontend routes.
+"""
+
+from datetime import date, datetime
+import secrets
+import sqlite3
+
+from services.store import SQLiteStore
+from utils.serialization import PreEncodedJSON
+
+# Seizure logs (SQLite; in-memory unless STORE_DB_PATH is set).
+# UNIQUE(patient, date) enforces one log per patient per day, date_ord (the
+# date's proleptic ordinal) serves the trend window and newest-first order,
+# and patient_lc backs the case-insensitive patient filter.
+_store = SQLiteStore("""
+    CREATE TABLE IF NOT EXISTS seizure_logs (
+        id TEXT PRIMARY KEY,
+        patient TEXT NOT NULL,
+        patient_lc TEXT NOT NULL,
+        date TEXT NOT NULL,
+        date_ord INTEGER NOT NULL,
+        occurred INTEGER NOT NULL,
+        notes TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT,
+        UNIQUE (patient, date)
+    );
+    CREATE INDEX IF NOT EXISTS seizure_logs_patient ON seizure_logs (patient_lc);
+    CREATE INDEX IF NOT EXISTS seizure_logs_order ON seizure_logs (date_ord DESC);
+""")
+
+_INSERT_LOG = (
+    "INSERT INTO seizure_logs (id, patient, patient_lc, date, date_ord, occurred, notes, created_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_SELECT_LOG = "SELECT * FROM seizure_logs WHERE id = ?"
+_UPDATE_LOG = "UPDATE seizure_logs SET occurred = ?, notes = ?, updated_at = ? WHERE id = ?"
+_DELETE_LOG = "DELETE FROM seizure_logs WHERE id = ?"
+# Totals and the recent-window sum in one pass: (log count, seizures, seizures since ordinal ?)
+_SUMMARY_COLUMNS = (
+    "SELECT COUNT(*), COALESCE(SUM(occurred), 0), "
+    "COALESCE(SUM(CASE WHEN date_ord >= ? THEN occurred ELSE 0 END), 0) FROM seizure_logs"
+)
+# Newest first; same-day logs keep insertion order
+_LOG_PAGE = " ORDER BY date_ord DESC, rowid LIMIT ? OFFSET ?"
+
+def _log_not_found(log_id):
+    """404 response for an unknown seizure log id."""
+    return {
+        "error": "Log not found",
+        "message": f"No seizure log found with ID: {log_id}"
+    }, 404
+
+# Parameter bounds for get_progress: a page never dumps the whole table, and
+# every value stays within SQLite's (and the JSON encoder's) integer range
+MAX_ANALYSIS_DAYS = 36500
+MAX_PAGE_LIMIT = 1000
+MAX_PAGE_OFFSET = 10 ** 9
+
+# Fixed error payloads, encoded once
+_MISSING_FIELD = {
+    field: PreEncodedJSON({
+        "error": "Missing required field",
+        "message": f"Field '{field}' is required"
+    })
+    for field in ('date', 'occurred', 'patient')
+}
+_EMPTY_PATIENT = PreEncodedJSON({
+    "error": "Invalid input",
+    "message": "Patient name cannot be empty"
+})
+_INVALID_OCCURRED = PreEncodedJSON({
+    "error": "Invalid occurred value",
+    "message": "Occurred must be 0 (no seizure) or 1 (seizure occurred)"
+})
+_INVALID_UPDATE_OCCURRED = PreEncodedJSON({
+    "error": "Invalid occurred value",
+    "message": "Occurred must be 0 or 1"
+})
+_FUTURE_DATE = PreEncodedJSON({
+    "error": "Invalid date",
+    "message": "Cannot log seizures for future dates"
+})
+_INVALID_DATE_FORMAT = PreEncodedJSON({
+    "error": "Invalid date format",
+    "message": "Date must be in YYYY-MM-DD format"
+})
+_INVALID_PAGE = PreEncodedJSON({
+    "error": "Invalid parameter",
+    "message": f"Limit must be an integer from 0 to {MAX_PAGE_LIMIT} and offset from 0 to {MAX_PAGE_OFFSET}"
+})
+_INVALID_DAYS = PreEncodedJSON({
+    "error": "Invalid parameter",
+    "message": f"Days parameter must be an integer from 0 to {MAX_ANALYSIS_DAYS}"
+})
+_NO_DATA = PreEncodedJSON({
+    "error": "No data provided",
+    "message": "Please provide data to update"
+})
+
+def _row_to_log(row):
+    """Convert a seizure_logs row to the API's seizure log dict."""
+    log = {
+        "id": row['id'],
+        "patient": row['patient'],
+        "date": row['date'],
+        "occurred": row['occurred'],
+        "notes": row['notes'],
+        "created_at": row['created_at']
+    }
+    if row['updated_at'] is not None:
+        log['updated_at'] = row['updated_at']
+    return log
+
+def log_seizure(data):
+    """
+    Log a seizure occurrence or non-occurrence.
+    
+    Args:
+        data: Request payload with date, occurred, patient and optional notes
+        
+    Returns:
+        tuple: (response dict, HTTP status code)
+    """
+    
+    try:
+        # Validate required fields
+        for field in _MISSING_FIELD:
+            if not data or field not in data:
+                return _MISSING_FIELD[field], 400
+        
+        date_str = data['date']
+        occurred = data['occurred']
+        patient = data['patient'].strip()
+        notes = data.get('notes', '').strip()
+        
+        # Validate patient name
+        if not patient:
+            return _EMPTY_PATIENT, 400
+        
+        # Validate occurred value
+        if occurred not in [0, 1]:
+            return _INVALID_OCCURRED, 400
+        
+        # One clock read serves the future-date check and created_at
+        now = datetime.now()
+        
+        # Validate date format (fromisoformat accepts other ISO forms, so
+        # require the canonical YYYY-MM-DD spelling to round-trip)
+        try:
+            log_date = date.fromisoformat(date_str)
+            if log_date.isoformat() != date_str:
+                raise ValueError(date_str)
+            
+            if log_date > now.date():
+                return _FUTURE_DATE, 400
+        except ValueError:
+            return _INVALID_DATE_FORMAT, 400
+        
+        # Create seizure log object
+        log_id = secrets.token_hex(16)
+        seizure_log = {
+            "id": log_id,
+            "patient": patient,
+            "date": date_str,
+            "occurred": occurred,
+            "notes": notes,
+            "created_at": now.isoformat()
+        }
+        
+        # Store seizure log unless one already exists for this date and patient
+        try:
+            with _store as conn:
+                conn.execute(_INSERT_LOG, (
+                    log_id, patient, patient.lower(), date_str, log_date.toordinal(),
+                    occurred, notes, seizure_log['created_at']
+                ))
+        except sqlite3.IntegrityError:
+            return {
+                "error": "Duplicate log",
+                "message": f"Seizure log already exists for {patient} on {date_str}"
+            }, 409
+        
+        return {
+            "status": "success",
+            "message": "Seizure log recorded successfully",
+            "log_id": log_id,
+            "log": seizure_log
+        }, 201
+        
+    except Exception as e:
+        return {
+            "error": "Logging failed",
+            "message": f"An error occurred while logging seizure: {str(e)}"
+        }, 500
+
+def get_progress(patient_filter='', days=7, limit=100, offset=0, summary_only=False):
+    """
+    Get treatment progress summary.
+    
+    Args:
+        patient_filter: Case-insensitive substring of the patient name
+        days: Number of days to analyze
+        limit: Maximum number of logs to return (newest first)
+        offset: Number of newest logs to skip
+        summary_only: Return the summary without any logs
+        
+    Returns:
+        tuple: (response dict, HTTP status code)
+    """
+    
+    try:
+        days = int(days)
+        if not 0 <= days <= MAX_ANALYSIS_DAYS:
+            raise ValueError(days)
+        
+        try:
+            limit = int(limit)
+            offset = int(offset)
+            if not (0 <= limit <= MAX_PAGE_LIMIT and 0 <= offset <= MAX_PAGE_OFFSET):
+                raise ValueError(limit, offset)
+        except ValueError:
+            return _INVALID_PAGE, 400
+        
+        # Aggregate and page in SQL over the matching patients' logs
+        where, params = "", []
+        if patient_filter:
+            where = " WHERE instr(patient_lc, ?) > 0"
+            params.append(patient_filter.lower())
+        
+        # Calculate 7-day trend (or specified days) alongside the totals
+        start_ord = datetime.now().date().toordinal() - days
+        
+        with _store as conn:
+            total_days, total_seizures, recent_seizures = conn.execute(
+                _SUMMARY_COLUMNS + where, [start_ord] + params
+            ).fetchone()
+            if summary_only or not total_days:
+                page_logs = []
+            else:
+                rows = conn.execute(
+                    "SELECT * FROM seizure_logs" + where + _LOG_PAGE, params + [limit, offset]
+                ).fetchall()
+                page_logs = [_row_to_log(row) for row in rows]
+        
+        has_more = not summary_only and offset + limit < total_days
+        
+        if not total_days:
+            return {
+                "status": "success",
+                "summary": {
+                    "total_seizures": 0,
+                    "seven_day_trend": 0,
+                    "progress": "No Data",
+                    "seizure_rate": 0.0
+                },
+                "logs": [],
+                "has_more": False
+            }, 200
+        
+        # Calculate seizure rate
+        seizure_rate = (total_seizures / total_days * 100) if total_days > 0 else 0.0
+        
+        # Determine progress status
+        if total_days < 7:
+            progress = "Insufficient Data"
+        elif recent_seizures == 0:
+            progress = "Improving"
+        elif recent_seizures <= total_seizures / total_days * days * 0.5:
+            progress = "Improving"
+        elif recent_seizures <= total_seizures / total_days * days * 1.2:
+            progress = "Stable"
+        else:
+            progress = "Needs Attention"
+        
+        return {
+            "status": "success",
+            "summary": {
+                "total_seizures": total_seizures,
+                "seven_day_trend": recent_seizures,
+                "progress": progress,
+                "seizure_rate": round(seizure_rate, 2),
+                "total_days_logged": total_days,
+                "analysis_period_days": days
+            },
+            "logs": page_logs,
+            "has_more": has_more
+        }, 200
+        
+    except ValueError as e:
+        return _INVALID_DAYS, 400
+        
+    except Exception as e:
+        return {
+            "error": "Analysis failed",
+            "message": f"An error occurred while analyzing progress: {str(e)}"
+        }, 500
+
+def update_seizure_log(log_id, data):
+    """
+    Update a seizure log entry.
+    
+    Args:
+        log_id: ID of the seizure log to update
+        data: Request payload with occurred and/or notes
+        
+    Returns:
+        tuple: (response dict, HTTP status code)
+    """
+    
+    try:
+        if not data:
+            return _NO_DATA, 400
+        
+        # Read, modify and write back in one locked transaction, so concurrent
+        # updates (from any worker) cannot overwrite each other's fields
+        with _store as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(_SELECT_LOG, (log_id,)).fetchone()
+            log = _row_to_log(row) if row else None
+            
+            if not log:
+                return _log_not_found(log_id)
+            
+            # Update fields if provided
+            if 'occurred' in data:
+                occurred = data['occurred']
+                if occurred not in [0, 1]:
+                    return _INVALID_UPDATE_OCCURRED, 400
+                log['occurred'] = occurred
+            
+            if 'notes' in data:
+                log['notes'] = data['notes'].strip()
+            
+            log['updated_at'] = datetime.now().isoformat()
+            
+            updated = conn.execute(_UPDATE_LOG, (log['occurred'], log['notes'], log['updated_at'], log_id)).rowcount
+        
+        # Deleted between the read and the write
+        if not updated:
+            return _log_not_found(log_id)
+        
+        return {
+            "status": "success",
+            "message": "Seizure log updated successfully",
+            "log": log
+        }, 200
+        
+    except Exception as e:
+        return {
+            "error": "Update failed",
+            "message": f"An error occurred while updating seizure log: {str(e)}"
+        }, 500
+
+def delete_seizure_log(log_id):
+    """
+    Delete a seizure log entry.
+    
+    Args:
+        log_id: ID of the seizure log to delete
+        
+    Returns:
+        tuple: (response dict, HTTP status code)
+    """
+    
+    try:
+        # Find and remove log
+        with _store as conn:
+            deleted = conn.execute(_DELETE_LOG, (log_id,)).rowcount
+        
+        if not deleted:
+            return _log_not_found(log_id)
+        
+        return {
+            "status": "success",
+            "message": "Seizure log deleted successfully"
+        }, 200
+        
+    except Exception as e:
+        return {
+            "error": "Deletion failed",
+            "message": f"An error occurred while deleting seizure log: {str(e)}"
+        }, 500 
\ No newline at end of file
@@ -0,0 +1,64 @@
+"""
+SQLite storage shared by the in-process services.
+Each service owns one table set on a lazily opened, lock-guarded connection.
+"""
+
+import os
+import sqlite3
+import threading
+
+# ':memory:' keeps data per process (as the old in-memory lists did);
+# point STORE_DB_PATH at a file to persist it and share it between workers
+STORE_DB_PATH = os.environ.get('STORE_DB_PATH', ':memory:')
+
+class SQLiteStore:
+    """
+    A service's SQLite connection, used as a context manager.
+
+    `with store as conn:` holds the store's lock for the duration of the
+    block and yields the connection, opening it (and creating the schema)
+    on first use in each process so no connection is carried across fork().
+    Connections run in autocommit mode; sqlite3 caches the prepared
+    statements of the module-level SQL strings the services execute.
+    A block that starts a transaction (e.g. BEGIN IMMEDIATE for a
+    read-modify-write that other processes must not interleave with) has
+    it committed on exit, or rolled back if the block raised.
+    """
+
+    def __init__(self, schema, path=None):
+        self._schema = schema
+        self._path = path or STORE_DB_PATH
+        self._conn = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        conn = sqlite3.connect(self._path, check_same_thread=False, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        if self._path != ':memory:':
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+        conn.executescript(self._schema)
+        return conn
+
+    def __enter__(self):
+        self._lock.acquire()
+        try:
+            if self._conn is None or self._pid != os.getpid():
+                self._conn = self._connect()
+                self._pid = os.getpid()
+        except Exception:
+            self._lock.release()
+            raise
+        return self._conn
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if self._conn.in_transaction:
+                if exc_type is None:
+                    self._conn.commit()
+                else:
+                    self._conn.rollback()
+        finally:
+            self._lock.release()
+        return False
@@ -6,25 +6,32 @@ Tests all endpoints with sample data to verify functionality.
 
 import requests
 import json
-import random
 import time
+import numpy as np
 from datetime import datetime, timedelta
 
 # API base URL
 BASE_URL = "http://localhost:5000"
 
+# Generator for the random EEG feature vectors
+RNG = np.random.default_rng()
+
+# One keep-alive session for every request, instead of a new connection per call
+SESSION = requests.Session()
+SESSION.mount("http://", requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=10))
+
 def test_health_endpoints():
     """Test health check endpoints."""
     print("🔍 Testing health endpoints...")
     
     # Test root endpoint
-    response = requests.get(f"{BASE_URL}/")
+    response = SESSION.get(f"{BASE_URL}/")
     print(f"Root endpoint: {response.status_code}")
     if response.status_code == 200:
         print(f"Response: {response.json()}")
     
     # Test API health endpoint
-    response = requests.get(f"{BASE_URL}/api/health")
+    response = SESSION.get(f"{BASE_URL}/api/health")
     print(f"API health endpoint: {response.status_code}")
     if response.status_code == 200:
         print(f"Response: {response.json()}")
@@ -36,14 +43,14 @@ def test_prediction_endpoint():
     print("🧠 Testing prediction endpoint...")
     
     # Generate random EEG features (115 values)
-    features = [random.uniform(0, 1) for _ in range(115)]
+    features = RNG.random(115).tolist()
     
     data = {
         "features": features
     }
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/api/predict",
             json=data,
             headers={"Content-Type": "application/json"}
@@ -76,7 +83,7 @@ def test_appointments_endpoints():
     }
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/api/appointments",
             json=appointment_data,
             headers={"Content-Type": "application/json"}
@@ -89,7 +96,7 @@ def test_appointments_endpoints():
             print(f"Appointment ID: {appointment_id}")
             
             # Test getting appointments
-            response = requests.get(f"{BASE_URL}/api/appointments")
+            response = SESSION.get(f"{BASE_URL}/api/appointments")
             print(f"Get appointments: {response.status_code}")
             if response.status_code == 200:
                 result = response.json()
@@ -116,7 +123,7 @@ def test_medication_endpoints():
     }
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/api/medication",
             json=medication_data,
             headers={"Content-Type": "application/json"}
@@ -129,7 +136,7 @@ def test_medication_endpoints():
             print(f"Medication ID: {medication_id}")
             
             # Test getting medications
-            response = requests.get(f"{BASE_URL}/api/medication")
+            response = SESSION.get(f"{BASE_URL}/api/medication")
             print(f"Get medications: {response.status_code}")
             if response.status_code == 200:
                 result = response.json()
@@ -155,7 +162,7 @@ def test_progress_endpoints():
     }
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/api/progress",
             json=progress_data,
             headers={"Content-Type": "application/json"}
@@ -168,7 +175,7 @@ def test_progress_endpoints():
             print(f"Log ID: {log_id}")
             
             # Test getting progress
-            response = requests.get(f"{BASE_URL}/api/progress")
+            response = SESSION.get(f"{BASE_URL}/api/progress")
             print(f"Get progress: {response.status_code}")
             if response.status_code == 200:
                 result = response.json()
@@ -0,0 +1,38 @@
+"""
+Tests for the static frontend routing.
+"""
+
+import unittest
+
+from app import create_app
+
+
+class HtmlRedirectTest(unittest.TestCase):
+    """Legacy .html page URLs."""
+
+    def setUp(self):
+        self.client = create_app('testing').test_client()
+
+    def test_page_html_redirects_to_route(self):
+        for page in ('predict', 'appointments', 'medication', 'progress'):
+            response = self.client.get(f'/{page}.html')
+            self.assertEqual(response.status_code, 302, page)
+            self.assertEqual(response.headers['Location'], f'/{page}')
+
+    def test_index_html_redirects_to_root(self):
+        response = self.client.get('/index.html')
+        self.assertEqual(response.status_code, 302)
+        # WhiteNoise answers this one itself, with a relative Location
+        self.assertEqual(response.headers['Location'], './')
+
+    def test_page_route_serves_html(self):
+        response = self.client.get('/predict')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'text/html')
+
+    def test_unknown_html_is_not_found(self):
+        self.assertEqual(self.client.get('/nope.html').status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
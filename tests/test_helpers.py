@@ -0,0 +1,37 @@
+"""
+Tests for the shared helper functions.
+"""
+
+import unittest
+
+import numpy as np
+
+from utils.helpers import normalize_feature_values
+
+
+class NormalizeFeatureValuesTest(unittest.TestCase):
+    """normalize_feature_values."""
+
+    def test_none_returns_empty_list(self):
+        self.assertEqual(normalize_feature_values(None), [])
+
+    def test_empty_list_returns_empty_list(self):
+        self.assertEqual(normalize_feature_values([]), [])
+
+    def test_empty_array_returns_empty_array(self):
+        result = normalize_feature_values(np.array([], dtype=np.float32))
+        self.assertIsInstance(result, np.ndarray)
+        self.assertEqual(result.shape, (0,))
+        self.assertEqual(result.dtype, np.float64)
+
+    def test_list_is_min_max_scaled(self):
+        self.assertEqual(normalize_feature_values([1, 2, 3]), [0.0, 0.5, 1.0])
+
+    def test_constant_array_maps_to_half(self):
+        result = normalize_feature_values(np.array([4.0, 4.0]))
+        self.assertIsInstance(result, np.ndarray)
+        np.testing.assert_array_equal(result, [0.5, 0.5])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+"""
+Tests for the Stripe payments endpoints.
+"""
+
+import unittest
+from unittest import mock
+
+from app import create_app
+from routes import payments
+
+
+class CreatePaymentIntentTest(unittest.TestCase):
+    """POST /api/payments/create-intent."""
+
+    def setUp(self):
+        self.client = create_app('testing').test_client()
+
+    def test_oversized_body_returns_413(self):
+        with mock.patch.object(payments, 'STRIPE_SECRET_KEY', 'sk_test_dummy'), \
+                mock.patch.object(payments.stripe.PaymentIntent, 'create') as create:
+            response = self.client.post(
+                '/api/payments/create-intent',
+                data=b'x' * (3 * 1024 * 1024),
+                content_type='application/json'
+            )
+
+        self.assertEqual(response.status_code, 413)
+        create.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+"""
+Tests for the prediction service.
+"""
+
+import threading
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from services import predict as predict_service
+
+
+class LazyKernelTest(unittest.TestCase):
+    """Lazy, once-per-process model loading."""
+
+    def setUp(self):
+        if not predict_service.load_model():
+            self.skipTest("model files not available")
+        patcher = mock.patch.object(predict_service, '_kernel', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_concurrent_first_predictions_build_one_kernel(self):
+        build = mock.Mock(wraps=predict_service._build_kernel)
+        features = np.random.default_rng(0).random(115).tolist()
+        results = []
+
+        def predict():
+            results.append(predict_service.predict_seizure(features)[1])
+
+        with mock.patch.object(predict_service, '_build_kernel', build):
+            threads = [threading.Thread(target=predict) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(build.call_count, 1)
+        self.assertEqual(results, [200] * 8)
+        self.assertTrue(predict_service.model_loaded())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,10 +3,25 @@ Helper utility functions for the Seizure Prediction API.
 Provides common validation and utility functions used across endpoints.
 """
 
+import calendar
 import re
-from datetime import datetime
+from datetime import date, datetime
 from typing import List, Dict, Any, Optional
 
+import numpy as np
+
+# Zero-padded YYYY-MM-DD and 24-hour HH:MM (applied with fullmatch, since
+# $ would also accept a trailing newline)
+_DATE_RE = re.compile(r'([0-9]{4})-([0-9]{2})-([0-9]{2})')
+_TIME_RE = re.compile(r'([01][0-9]|2[0-3]):[0-5][0-9]')
+
+# Allow letters, spaces, hyphens, and apostrophes
+_PATIENT_NAME_RE = re.compile(r'^[a-zA-Z\s\-\']+$')
+# Allow letters, numbers, spaces, hyphens, and parentheses
+_MEDICATION_NAME_RE = re.compile(r'^[a-zA-Z0-9\s\-\()]+$')
+# Characters stripped by sanitize_input
+_SANITIZE_TABLE = str.maketrans('', '', '<>"\'')
+
 def validate_date_format(date_str: str) -> bool:
     """
     Validate if a date string is in YYYY-MM-DD format.
@@ -17,11 +32,11 @@ def validate_date_format(date_str: str) -> bool:
     Returns:
         bool: True if valid format, False otherwise
     """
-    try:
-        datetime.strptime(date_str, '%Y-%m-%d')
-        return True
-    except ValueError:
+    match = _DATE_RE.fullmatch(date_str)
+    if not match:
         return False
+    year, month, day = map(int, match.groups())
+    return year >= 1 and 1 <= month <= 12 and 1 <= day <= calendar.monthrange(year, month)[1]
 
 def validate_time_format(time_str: str) -> bool:
     """
@@ -33,11 +48,7 @@ def validate_time_format(time_str: str) -> bool:
     Returns:
         bool: True if valid format, False otherwise
     """
-    try:
-        datetime.strptime(time_str, '%H:%M')
-        return True
-    except ValueError:
-        return False
+    return bool(_TIME_RE.fullmatch(time_str))
 
 def validate_patient_name(name: str) -> bool:
     """
@@ -52,9 +63,7 @@ def validate_patient_name(name: str) -> bool:
     if not name or not name.strip():
         return False
     
-    # Allow letters, spaces, hyphens, and apostrophes
-    pattern = r'^[a-zA-Z\s\-\']+$'
-    return bool(re.match(pattern, name.strip()))
+    return bool(_PATIENT_NAME_RE.match(name.strip()))
 
 def validate_medication_name(name: str) -> bool:
     """
@@ -69,9 +78,7 @@ def validate_medication_name(name: str) -> bool:
     if not name or not name.strip():
         return False
     
-    # Allow letters, numbers, spaces, hyphens, and parentheses
-    pattern = r'^[a-zA-Z0-9\s\-\()]+$'
-    return bool(re.match(pattern, name.strip()))
+    return bool(_MEDICATION_NAME_RE.match(name.strip()))
 
 def generate_error_response(message: str, error_type: str = "validation_error") -> Dict[str, Any]:
     """
@@ -122,8 +129,7 @@ def sanitize_input(text: str) -> str:
         return ""
     
     # Remove potentially dangerous characters
-    sanitized = re.sub(r'[<>"\']', '', text.strip())
-    return sanitized
+    return text.strip().translate(_SANITIZE_TABLE)
 
 def format_datetime_for_display(dt: datetime) -> str:
     """
@@ -148,7 +154,9 @@ def calculate_age_from_date(birth_date: str) -> Optional[int]:
         int: Age in years, or None if invalid date
     """
     try:
-        birth_dt = datetime.strptime(birth_date, '%Y-%m-%d')
+        birth_dt = date.fromisoformat(birth_date)
+        if birth_dt.isoformat() != birth_date:
+            return None
         today = datetime.now()
         age = today.year - birth_dt.year
         
@@ -165,44 +173,39 @@ def validate_eeg_features(features: List[float]) -> bool:
     Validate EEG feature array.
     
     Args:
-        features: List of EEG feature values
+        features: List (or numpy array) of EEG feature values
         
     Returns:
         bool: True if valid, False otherwise
     """
-    if not isinstance(features, list):
-        return False
-    
-    if len(features) != 115:
-        return False
-    
-    # Check if all values are numeric
+    # Check that all 115 values are numeric and finite in one pass
     try:
-        for feature in features:
-            float(feature)
-        return True
+        values = np.asarray(features, dtype=np.float64)
     except (ValueError, TypeError):
         return False
+    
+    return values.shape == (115,) and bool(np.isfinite(values).all())
 
 def normalize_feature_values(features: List[float]) -> List[float]:
     """
     Normalize feature values to prevent extreme outliers.
     
     Args:
-        features: List of feature values
+        features: List (or numpy array) of feature values
         
     Returns:
-        List[float]: Normalized feature values
+        List[float]: Normalized feature values (a numpy array for array input)
     """
-    if not features:
-        return []
+    if features is None or len(features) == 0:
+        return np.asarray(features, dtype=float) if isinstance(features, np.ndarray) else []
     
     # Simple min-max normalization to [0, 1] range
-    min_val = min(features)
-    max_val = max(features)
+    values = np.asarray(features, dtype=np.float64)
+    min_val = values.min()
+    max_val = values.max()
     
     if max_val == min_val:
-        return [0.5] * len(features)
-    
-    normalized = [(x - min_val) / (max_val - min_val) for x in features]
-    return normalized 
\ No newline at end of file
+        normalized = np.full_like(values, 0.5)
+    else:
+        normalized = (values - min_val) / (max_val - min_val)
+    return normalized if isinstance(features, np.ndarray) else normalized.tolist()
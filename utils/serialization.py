@@ -0,0 +1,70 @@
+"""
+JSON serialization helpers for the Seizure Prediction API.
+Provides an orjson-backed JSON provider used for all API requests and responses,
+pre-encoded payloads for constant responses, and a request body decoder.
+"""
+
+from typing import Any, Union
+
+import orjson
+from flask import request
+from flask.json.provider import DefaultJSONProvider
+
+def load_request_json() -> Any:
+    """
+    Decode the current request body with orjson, reading it exactly once.
+    
+    Like request.get_json(silent=True), returns None for an empty or malformed
+    body, but does not buffer the raw body on the request or check Content-Type.
+    """
+    raw_body = request.get_data(cache=False)
+    if not raw_body:
+        return None
+    try:
+        return orjson.loads(raw_body)
+    except orjson.JSONDecodeError:
+        return None
+
+class PreEncodedJSON(dict):
+    """
+    A constant JSON payload whose encoding is computed once, at definition.
+    
+    It is still a dict for code that reads the payload (e.g. the frontend
+    routes), but jsonify() sends the cached bytes instead of re-serializing
+    it. Instances are shared between requests, so never mutate one.
+    """
+    
+    __slots__ = ('encoded',)
+    
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.encoded = orjson.dumps(self, option=orjson.OPT_SORT_KEYS)
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that encodes and decodes with orjson instead of the stdlib json module.
+    
+    Responses are always compact (no pretty printing in debug mode) and are
+    built directly from the encoded bytes. Keys stay sorted as with Flask's
+    default provider, numpy scalars/arrays are encoded natively, and other
+    types orjson does not handle fall back to Flask's default conversions.
+    PreEncodedJSON payloads are sent as their cached bytes.
+    """
+    
+    def _encode(self, obj: Any) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option)
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return self._encode(obj).decode('utf-8')
+    
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        # Also backs request.get_json(); orjson.JSONDecodeError is a ValueError
+        return orjson.loads(s)
+    
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = obj.encoded if isinstance(obj, PreEncodedJSON) else self._encode(obj)
+        return self._app.response_class(body, mimetype=self.mimetype)